@@ -1,6 +1,5 @@
 #include "bitscrape/dht/bootstrap.hpp"
 
-#include <random>
 #include <chrono>
 #include <future>
 
@@ -229,21 +228,9 @@ bool Bootstrap::perform_random_lookup() {
 }
 
 types::NodeID Bootstrap::generate_random_node_id() const {
-    // Create a random number generator
-    std::random_device rd;
-    std::mt19937 gen(rd());
-    std::uniform_int_distribution<uint8_t> dis(0, 255);
-
-    // Generate random bytes for the node ID
-    std::vector<uint8_t> bytes;
-    bytes.reserve(types::NodeID::SIZE);
-
-    for (size_t i = 0; i < types::NodeID::SIZE; ++i) {
-        bytes.push_back(dis(gen));
-    }
-
-    // Create a node ID from the random bytes
-    return types::NodeID(bytes);
+    // Fill the node ID straight from the OS CSPRNG instead of seeding a fresh
+    // Mersenne Twister for every lookup target
+    return types::NodeID::secure_random();
 }
 
 } // namespace bitscrape::dht